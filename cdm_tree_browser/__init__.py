@@ -16,5 +16,10 @@ def _jupyter_labextension_paths():
     }]
 
 
-# Import and expose the setup function
-from .cdm_methods import get_cdm_methods
+# Expose the setup function, importing cdm_methods only on first access
+def __getattr__(name):
+    if name == "get_cdm_methods":
+        from .cdm_methods import get_cdm_methods
+        globals()[name] = get_cdm_methods
+        return get_cdm_methods
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
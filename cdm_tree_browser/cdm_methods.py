@@ -1,51 +1,125 @@
+import functools
+import importlib.util
+import json
+import logging
+
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    # orjson is optional; fall back to the standard library encoder
+    _dumps = json.dumps
+
+logger = logging.getLogger(__name__)
+
+# Submodules the BERDL wrappers import from, probed before choosing BERDL
+_BERDL_MODULES = (
+    'berdl_notebook_utils.spark',
+    'berdl_notebook_utils.minio_governance.operations',
+)
+
+
+def _berdl_get_table_schema(*args, **kwargs):
+    from berdl_notebook_utils.spark import get_table_schema
+    return get_table_schema(*args, **kwargs)
+
+
+def _berdl_get_databases(*args, **kwargs):
+    from berdl_notebook_utils.spark import get_databases
+    return get_databases(*args, **kwargs)
+
+
+def _berdl_get_tables(*args, **kwargs):
+    from berdl_notebook_utils.spark import get_tables
+    return get_tables(*args, **kwargs)
+
+
+def _berdl_get_my_groups(return_json=False):
+    """
+    Wraps berdl_notebook_utils get_my_groups() to return a dict or JSON string.
+    """
+    from berdl_notebook_utils.minio_governance.operations import get_my_groups
+
+    result = get_my_groups()
+    result_dict = {
+        'username': result.username,
+        'groups': result.groups,
+        'group_count': result.group_count,
+    }
+    if return_json:
+        return _dumps(result_dict)
+    return result_dict
+
+
+def _berdl_get_namespace_prefix(tenant=None, return_json=False):
+    """
+    Wraps berdl_notebook_utils get_namespace_prefix() to return a dict or JSON string.
+    """
+    from berdl_notebook_utils.minio_governance.operations import get_namespace_prefix
+
+    result = get_namespace_prefix(tenant=tenant)
+    result_dict = {
+        'username': result.username,
+        'user_namespace_prefix': result.user_namespace_prefix,
+        'tenant': getattr(result, 'tenant', None),
+        'tenant_namespace_prefix': getattr(result, 'tenant_namespace_prefix', None),
+    }
+    if return_json:
+        return _dumps(result_dict)
+    return result_dict
+
+
+def _missing_berdl_module():
+    """
+    Returns the name of the first BERDL module that is not installed, or None
+    if all are available. Only locates the modules; none of them are executed
+    apart from the parent packages find_spec has to import.
+    """
+    if importlib.util.find_spec('berdl_notebook_utils') is None:
+        return 'berdl_notebook_utils'
+    for module_name in _BERDL_MODULES:
+        if importlib.util.find_spec(module_name) is None:
+            return module_name
+    return None
+
+
+@functools.lru_cache(maxsize=1)
 def get_cdm_methods():
     """
     Returns BERDL data access methods.
     Tries to import from BERDL (berdl_notebook_utils) first, falls back to mock functions.
     Returns (get_table_schema, get_databases, get_tables, get_my_groups, get_namespace_prefix, using_mocks)
+
+    The result is cached, since the frontend calls this before every kernel request.
+    BERDL modules are only probed here, so PySpark is not imported until a BERDL
+    function is actually called.
     """
     try:
-        from berdl_notebook_utils.spark import (
-            get_databases,
-            get_tables,
-            get_table_schema,
-        )
-        from berdl_notebook_utils.minio_governance.operations import (
-            get_my_groups as _get_my_groups,
-            get_namespace_prefix as _get_namespace_prefix,
-        )
-        print("Using BERDL berdl_notebook_utils functions")
-
-        def get_my_groups(return_json=False):
-            import json
-            result = _get_my_groups()
-            result_dict = {
-                'username': result.username,
-                'groups': result.groups,
-                'group_count': result.group_count,
-            }
-            if return_json:
-                return json.dumps(result_dict)
-            return result_dict
-
-        def get_namespace_prefix(tenant=None, return_json=False):
-            import json
-            result = _get_namespace_prefix(tenant=tenant)
-            result_dict = {
-                'username': result.username,
-                'user_namespace_prefix': result.user_namespace_prefix,
-                'tenant': getattr(result, 'tenant', None),
-                'tenant_namespace_prefix': getattr(result, 'tenant_namespace_prefix', None),
-            }
-            if return_json:
-                return json.dumps(result_dict)
-            return result_dict
-
-        return get_table_schema, get_databases, get_tables, get_my_groups, get_namespace_prefix, False
+        missing = _missing_berdl_module()
     except ImportError as e:
-        print(f"BERDL import failed: {e}")
-        print("Using mock functions")
+        logger.warning("BERDL import failed: %s; using mock functions", e)
+    else:
+        if missing is None:
+            logger.info("Using BERDL berdl_notebook_utils functions")
+            return (
+                _berdl_get_table_schema,
+                _berdl_get_databases,
+                _berdl_get_tables,
+                _berdl_get_my_groups,
+                _berdl_get_namespace_prefix,
+                False,
+            )
+        logger.warning("BERDL import failed: No module named '%s'; using mock functions", missing)
 
     from .mock_definitions import get_table_schema, get_databases, get_tables, get_my_groups, get_namespace_prefix
 
-    return get_table_schema, get_databases, get_tables, get_my_groups, get_namespace_prefix, True
\ No newline at end of file
+    return get_table_schema, get_databases, get_tables, get_my_groups, get_namespace_prefix, True
+
+
+def reset_cdm_methods():
+    """
+    Clears the cached result of get_cdm_methods() so the next call re-resolves the backend.
+    """
+    get_cdm_methods.cache_clear()
@@ -5,6 +5,7 @@ These functions mimic the behavior of berdl_notebook_utils.spark functions
 for development and testing when a real BERDL environment is not available.
 """
 
+import functools
 import json
 import time
 
@@ -20,11 +21,21 @@ from .mock_data import (
     MOCK_USERNAME,
 )
 
+# Serialized forms of the static mock data, built once at import.
+# The list/dict forms are shared between calls and must not be mutated by callers.
+_MOCK_DB_LIST = tuple(MOCK_DATABASE_STRUCTURE)
+_MOCK_DB_KEYS_JSON = json.dumps(_MOCK_DB_LIST)
+_MOCK_GROUPS_DICT = MOCK_GROUPS._asdict()
+_MOCK_GROUPS_JSON = json.dumps(_MOCK_GROUPS_DICT)
+_MOCK_TABLES_JSON = {db: json.dumps(tables) for db, tables in MOCK_DATABASE_STRUCTURE.items()}
+_MOCK_SCHEMAS_JSON = {name: json.dumps(cols) for name, cols in MOCK_TABLE_SCHEMAS.items()}
+_MOCK_DEFAULT_JSON = json.dumps(MOCK_DEFAULT_COLUMNS)
+
 
 def get_table_schema(database_name, table_name, return_json=False):
     """
     Mock function to get table schema information.
-    Returns list of column names to match actual kernel function behavior.
+    Returns column names to match actual kernel function behavior.
 
     Args:
         database_name (str): Name of the database
@@ -32,15 +43,14 @@ def get_table_schema(database_name, table_name, return_json=False):
         return_json (bool): Whether to return JSON string
 
     Returns:
-        list or str: List of column names
+        tuple or str: Column names (shared, read-only tuple) or JSON string
     """
-    time.sleep(MOCK_DELAY)
-    # Look up specific schema, fall back to default columns
-    columns = MOCK_TABLE_SCHEMAS.get(table_name, MOCK_DEFAULT_COLUMNS)
-
+    if MOCK_DELAY:
+        time.sleep(MOCK_DELAY)
     if return_json:
-        return json.dumps(columns)
-    return columns
+        return _MOCK_SCHEMAS_JSON.get(table_name, _MOCK_DEFAULT_JSON)
+    # Look up specific schema, fall back to default columns
+    return MOCK_TABLE_SCHEMAS.get(table_name, MOCK_DEFAULT_COLUMNS)
 
 
 def get_my_groups(return_json=False):
@@ -54,10 +64,11 @@ def get_my_groups(return_json=False):
     Returns:
         dict or str: User groups response with username, groups list, and group_count
     """
-    time.sleep(MOCK_DELAY)
+    if MOCK_DELAY:
+        time.sleep(MOCK_DELAY)
     if return_json:
-        return json.dumps(MOCK_GROUPS)
-    return MOCK_GROUPS
+        return _MOCK_GROUPS_JSON
+    return _MOCK_GROUPS_DICT
 
 
 def get_databases(use_hms=True, return_json=True, filter_by_namespace=True):
@@ -71,14 +82,13 @@ def get_databases(use_hms=True, return_json=True, filter_by_namespace=True):
         filter_by_namespace (bool): Whether to filter by namespace (ignored in mock)
 
     Returns:
-        list or str: List of database names
+        tuple or str: Database names (shared, read-only tuple) or JSON string
     """
-    time.sleep(MOCK_DELAY)
-    all_dbs = list(MOCK_DATABASE_STRUCTURE.keys())
-
+    if MOCK_DELAY:
+        time.sleep(MOCK_DELAY)
     if return_json:
-        return json.dumps(all_dbs)
-    return all_dbs
+        return _MOCK_DB_KEYS_JSON
+    return _MOCK_DB_LIST
 
 
 def get_tables(database, use_hms=True, return_json=True):
@@ -92,29 +102,21 @@ def get_tables(database, use_hms=True, return_json=True):
         return_json (bool): Whether to return JSON string instead of list
 
     Returns:
-        list or str: List of table names
+        tuple or str: Table names (shared, read-only tuple) or JSON string
     """
-    time.sleep(MOCK_DELAY)
-    tables = MOCK_DATABASE_STRUCTURE.get(database, [])
-
+    if MOCK_DELAY:
+        time.sleep(MOCK_DELAY)
     if return_json:
-        return json.dumps(tables)
-    return tables
+        return _MOCK_TABLES_JSON.get(database, '[]')
+    return MOCK_DATABASE_STRUCTURE.get(database, ())
 
 
-def get_namespace_prefix(tenant=None, return_json=False):
+@functools.lru_cache(maxsize=256)
+def _namespace_prefix_response(tenant):
     """
-    Mock function that returns namespace prefix for a tenant.
-    Mimics the berdl_notebook_utils.minio_governance.operations.get_namespace_prefix() function.
-
-    Args:
-        tenant (str): Optional tenant name
-        return_json (bool): Whether to return JSON string instead of dict
-
-    Returns:
-        dict or str: Namespace prefix information
+    Builds the namespace prefix response for a tenant as a (dict, JSON string) pair.
+    Cached per tenant; the dict is shared between calls and must not be mutated.
     """
-    time.sleep(MOCK_DELAY)
     # Get tenant prefix from config, or generate from tenant name
     if tenant:
         tenant_prefix = MOCK_NAMESPACE_PREFIXES.get(
@@ -130,7 +132,25 @@ def get_namespace_prefix(tenant=None, return_json=False):
         'tenant': tenant,
         'tenant_namespace_prefix': tenant_prefix
     }
+    return result, json.dumps(result)
+
+
+def get_namespace_prefix(tenant=None, return_json=False):
+    """
+    Mock function that returns namespace prefix for a tenant.
+    Mimics the berdl_notebook_utils.minio_governance.operations.get_namespace_prefix() function.
+
+    Args:
+        tenant (str): Optional tenant name
+        return_json (bool): Whether to return JSON string instead of dict
+
+    Returns:
+        dict or str: Namespace prefix information
+    """
+    if MOCK_DELAY:
+        time.sleep(MOCK_DELAY)
+    result, result_json = _namespace_prefix_response(tenant)
 
     if return_json:
-        return json.dumps(result)
+        return result_json
     return result